@@ -13,7 +13,8 @@ import json
 import re
 import subprocess
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from urllib.parse import urlparse
 from zoneinfo import ZoneInfo
 
@@ -414,8 +415,13 @@ def ai_chat_app_display_name(normalized_app: str) -> str:
     return AI_CHAT_APP_DISPLAY_NAMES.get(normalized_app, normalized_app.title())
 
 
+@lru_cache(maxsize=1024)
 def match_ai_chat_site(domain: str) -> str | None:
-    """Return the display name if `domain` matches a known AI chat site, else None."""
+    """Return the display name if `domain` matches a known AI chat site, else None.
+
+    Cached per distinct domain: the scan over AI_CHAT_SITES is linear, and a
+    day's events repeat the same few dozen domains thousands of times.
+    """
     d = domain.lower()
     for ai_site in AI_CHAT_SITES:
         if is_domain_or_subdomain(d, ai_site):
@@ -428,10 +434,25 @@ def match_ai_chat_site(domain: str) -> str | None:
 # ============================================================================
 
 
-def parse_timestamp(ts_str: str) -> datetime:
+def parse_timestamp(ts_str: str, _tz=TARGET_TZ) -> datetime:
     """Parse ISO8601 timestamp to datetime in journal timezone."""
-    dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-    return dt.astimezone(TARGET_TZ)
+    # fromisoformat accepts the trailing "Z" natively on 3.11+, which every
+    # script header here already requires; skip the per-call replace.
+    dt = datetime.fromisoformat(ts_str)
+    return dt.astimezone(_tz)
+
+
+@lru_cache(maxsize=8)
+def tz_offset_seconds(epoch_day: int) -> float:
+    """UTC offset of TARGET_TZ (in seconds) for the given UTC epoch day.
+
+    Memoized so hot paths can map epoch timestamps to journal-local hours
+    with plain arithmetic instead of an astimezone per event. The offset is
+    resolved once per day; a DST transition mid-day would only skew that
+    single day, and the journal timezone (default Asia/Singapore) has none.
+    """
+    dt = datetime.fromtimestamp(epoch_day * 86400, tz=timezone.utc)
+    return TARGET_TZ.utcoffset(dt).total_seconds()
 
 
 def get_event_time_range(event: dict) -> tuple[datetime, datetime] | tuple[None, None]:
@@ -538,10 +559,14 @@ def filter_events_by_afk(events: list, not_afk_periods_by_host: dict) -> list:
     return filtered_events
 
 
+@lru_cache(maxsize=4096)
 def normalize_app_name(app: str) -> str:
     """Normalize app name for cross-platform consistency.
     - Strips .exe suffix (Windows)
     - Converts to lowercase
+
+    Cached: a day has thousands of events but only dozens of distinct app
+    names, so the lower/strip work runs once per distinct value.
     """
     app = app.lower()
     if app.endswith(".exe"):
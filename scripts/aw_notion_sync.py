@@ -4,6 +4,7 @@
 #     "requests",
 #     "notion-client",
 #     "python-dotenv",
+#     "orjson",
 # ]
 # ///
 
@@ -21,15 +22,23 @@ Supports:
 import os
 import sys
 import json
-import glob
 import argparse
-import re
-from datetime import datetime, timedelta, time, date
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from datetime import datetime, timedelta, time, date, timezone
 from collections import defaultdict
-from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 from notion_client import Client
 from dotenv import load_dotenv
 
+# C-level JSON parser for the multi-megabyte AW dumps; stdlib fallback keeps
+# the script runnable outside the uv-managed environment.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from notion_day import Contribution, PRIORITY_BIO, PRIORITY_WORK, write_day_page
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -56,8 +65,8 @@ from aw_common import (  # noqa: E402
     get_planning_site_name,
     match_ai_chat_site,
     normalize_app_name,
-    parse_timestamp,
     phone_app_category,
+    tz_offset_seconds,
 )
 
 NOTION_API_KEY = os.getenv("NOTION_TIME_ACCOUNTANT_SECRET")
@@ -74,6 +83,43 @@ BIO_HOUR_VALUE = "bio"  # hourly select option for sleep (Notion auto-creates it
 
 # Table header used to identify our stats table
 AW_TABLE_HEADER = "Hour"
+AW_TABLE_WIDTH = 6
+
+# Sidecar cache of {date_str: {"page_id": ..., "table_block_id": ...}} so the
+# routine sliding-window re-syncs skip the data_sources.query (and the table
+# re-discovery listing) round-trips. Best-effort: read/write errors fall back
+# to the normal query path, and a failed sync drops the date's entry in case
+# the cached ids went stale.
+AW_SYNC_CACHE = os.path.join(current_dir, ".aw_sync_cache.json")
+
+
+def _read_sync_cache() -> dict:
+    try:
+        with open(AW_SYNC_CACHE) as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_sync_cache(cache: dict) -> None:
+    try:
+        with open(AW_SYNC_CACHE, "w") as f:
+            json.dump(cache, f)
+    except Exception:
+        pass
+
+# Interning table for lowered hot-path strings (domains mostly): the same
+# handful of values repeats across thousands of events, so .lower() runs
+# once per distinct string instead of once per event.
+_LOWER_CACHE: dict[str, str] = {}
+
+
+def _lc(s: str) -> str:
+    cached = _LOWER_CACHE.get(s)
+    if cached is None:
+        cached = _LOWER_CACHE.setdefault(s, s.lower())
+    return cached
 
 # Hourly select thresholds (in seconds)
 DEEP_WORK_DEV_TOOLS_THRESHOLD = 30 * 60  # 30 minutes
@@ -82,6 +128,61 @@ SHALLOW_WORK_PLANNING_THRESHOLD = 30 * 60  # 30 minutes
 SHALLOW_WORK_ACTIVE_TIME_THRESHOLD = 50 * 60  # 50 minutes
 
 
+@lru_cache(maxsize=1 << 16)
+def _parse_ts(ts_str: str) -> float:
+    """Epoch seconds for an ISO timestamp string, memoized per unique string.
+
+    AW dumps repeat identical second-resolution timestamps a lot (and the same
+    events recur across the overlapping file dates), so caching the parse
+    amortizes fromisoformat across duplicates.
+    """
+    # fromisoformat accepts the trailing "Z" natively on 3.11+ (the script
+    # header already pins requires-python >= 3.11).
+    return datetime.fromisoformat(ts_str).timestamp()
+
+
+def _load_aw_file(filepath: str, start_ts: float, end_ts: float) -> list:
+    """Parse one AW dump file into (dedup_key, bucket_name, event) triples.
+
+    Events are filtered to the [start_ts, end_ts) UTC window and tagged with
+    `_epoch` so hour bucketing never re-reads the timestamp string. Runs on
+    worker threads, so it touches no shared state.
+    """
+    out = []
+    try:
+        with open(filepath, "rb") as f:
+            data = _json_loads(f.read())
+    except Exception as e:
+        print(f"Error loading {filepath}: {e}")
+        return out
+
+    for bucket_name, events in data.items():
+        for event in events:
+            ts_str = event.get("timestamp", "")
+            if not ts_str:
+                continue
+
+            # fromisoformat output is already UTC-aware for AW timestamps;
+            # skip the TARGET_TZ conversion (only hour bucketing needs it).
+            try:
+                ep = _parse_ts(ts_str)
+            except Exception:
+                continue
+            if not (start_ts <= ep < end_ts):
+                continue
+
+            event["_epoch"] = ep
+            data_fields = event.get("data") or {}
+            key = hash(
+                f"{bucket_name}\0{ts_str}"
+                f"\0{data_fields.get('app')}"
+                f"\0{data_fields.get('title')}"
+                f"\0{data_fields.get('url')}"
+            )
+            out.append((key, bucket_name, event))
+    return out
+
+
 def load_aw_data_for_journal_day(journal_date: date) -> dict:
     """
     Load ActivityWatch data for a journal day, accounting for timezone differences.
@@ -92,9 +193,13 @@ def load_aw_data_for_journal_day(journal_date: date) -> dict:
 
     Returns a dict with bucket names as keys and deduplicated, filtered event lists.
     """
-    # Define the exact boundaries of this journal day in TARGET_TZ
+    # Define the exact boundaries of this journal day in TARGET_TZ.
+    # Convert them to UTC once so the per-event filter can compare the
+    # parsed (UTC-aware) timestamp directly without an astimezone per event.
     day_start = datetime.combine(journal_date, time(0, 0), tzinfo=TARGET_TZ)
     day_end = day_start + timedelta(days=1)
+    day_start_utc = day_start.astimezone(timezone.utc)
+    day_end_utc = day_end.astimezone(timezone.utc)
 
     # File dates to load: journal_date and the day before
     # This ensures we capture events even if file naming uses a different timezone
@@ -106,233 +211,221 @@ def load_aw_data_for_journal_day(journal_date: date) -> dict:
         }
     )
 
-    # Track seen events per bucket to deduplicate
-    # Key: (bucket_name, timestamp_str) -> event
-    seen_events: dict[tuple[str, str], dict] = {}
-
-    for file_date in file_dates:
-        pattern = os.path.join(AW_DATA_DIR, f"aw_*_{file_date}.json")
-        files = glob.glob(pattern)
-
-        for filepath in files:
-            try:
-                with open(filepath, "r") as f:
-                    data = json.load(f)
-                    for bucket_name, events in data.items():
-                        for event in events:
-                            ts_str = event.get("timestamp", "")
-                            if not ts_str:
-                                continue
-
-                            data_fields = event.get("data") or {}
-                            key = (
-                                bucket_name,
-                                ts_str,
-                                data_fields.get("app"),
-                                data_fields.get("title"),
-                                data_fields.get("url"),
-                            )
-                            if key in seen_events:
-                                continue
-
-                            # Parse and filter to journal day boundaries
-                            try:
-                                dt = parse_timestamp(ts_str)
-                                if day_start <= dt < day_end:
-                                    seen_events[key] = event
-                            except Exception:
-                                continue
-
-            except Exception as e:
-                print(f"Error loading {filepath}: {e}")
-
-    # Group by bucket name
-    merged = defaultdict(list)
-    for key, event in seen_events.items():
-        bucket_name = key[0]
-        merged[bucket_name].append(event)
+    # One directory scan with cheap string predicates instead of a glob
+    # (and its fnmatch machinery) per file date. Sorted so the dedup pass
+    # sees files in a stable order.
+    wanted = tuple(f"_{file_date}.json" for file_date in file_dates)
+    try:
+        with os.scandir(AW_DATA_DIR) as it:
+            filepaths = sorted(
+                entry.path
+                for entry in it
+                if entry.name.startswith("aw_") and entry.name.endswith(wanted)
+            )
+    except FileNotFoundError:
+        filepaths = []
+
+    # Track seen events to deduplicate. A single 64-bit hash of the identity
+    # fields (built-in siphash over one joined string) replaces the old
+    # 5-tuple key: one int per entry instead of a tuple holding 5 strings.
+    # Collision odds at daily event counts are negligible for dedupe.
+    seen_keys: set[int] = set()
+    merged: defaultdict[str, list] = defaultdict(list)
+    total_events = 0
+
+    # Parse files concurrently (read + JSON decode dominate and release the
+    # GIL); merging into the shared dedup set stays serial and cheap.
+    # executor.map preserves filepath order, so dedup winners are the same
+    # as with the old sequential loop.
+    start_ts = day_start_utc.timestamp()
+    end_ts = day_end_utc.timestamp()
+    if filepaths:
+        with ThreadPoolExecutor(max_workers=min(8, len(filepaths))) as pool:
+            parsed = pool.map(
+                lambda fp: _load_aw_file(fp, start_ts, end_ts), filepaths
+            )
+            for triples in parsed:
+                for key, bucket_name, event in triples:
+                    if key in seen_keys:
+                        continue
+                    seen_keys.add(key)
+                    merged[bucket_name].append(event)
+                    total_events += 1
 
     print(
-        f"Loaded {len(seen_events)} unique events for {journal_date} from files: {file_dates}"
+        f"Loaded {total_events} unique events for {journal_date} from files: {file_dates}"
     )
     return dict(merged)
 
 
-def bucket_events_by_hour(events: list) -> dict:
+def _event_epoch(event: dict) -> float:
+    """Epoch seconds for an event, parsing its timestamp string at most once.
+
+    The loader pre-fills `_epoch`; events built elsewhere (tests, callers
+    passing raw AW data) fall back to a one-time parse cached on the event.
     """
-    Group events by hour (0-23), splitting events that span multiple hours.
+    ep = event.get("_epoch")
+    if ep is None:
+        ep = _parse_ts(event["timestamp"])
+        event["_epoch"] = ep
+    return ep
+
 
-    Events with duration exceeding their start hour are split proportionally
-    across each hour they span. Each hour's duration is capped at 3600 seconds.
+def _iter_hour_shares(events: list):
+    """Yield (hour, event, duration) shares, splitting events that span
+    multiple hours.
+
+    duration is the event's share of that hour (capped at 3600 seconds);
+    splitting only repeats the (event, share) pair — the event dict itself
+    is never copied. Hours come from cached epoch seconds plus the memoized
+    journal-tz offset — no datetime objects or zoneinfo lookups per event.
     """
-    hourly = defaultdict(list)
     for event in events:
         try:
-            dt = parse_timestamp(event["timestamp"])
+            ep = _event_epoch(event)
+            local = ep + tz_offset_seconds(int(ep // 86400))
+            hour = int(local // 3600) % 24
             duration = event.get("duration", 0) or 0
 
             if duration <= 0:
                 # Zero-duration events go to their start hour
-                hourly[dt.hour].append(event)
+                yield hour, event, 0
                 continue
 
             # Calculate how much time remains in the start hour
-            seconds_into_hour = dt.minute * 60 + dt.second + dt.microsecond / 1_000_000
+            seconds_into_hour = local % 3600
             remaining_in_hour = 3600 - seconds_into_hour
 
             if duration <= remaining_in_hour:
                 # Event fits entirely within its start hour
-                hourly[dt.hour].append(event)
+                yield hour, event, duration
             else:
                 # Event spans multiple hours - split it
-                current_hour = dt.hour
                 remaining_duration = duration
                 first_chunk = min(remaining_in_hour, remaining_duration)
 
                 # First partial hour
                 if first_chunk > 0:
-                    split_event = {**event, "duration": first_chunk}
-                    hourly[current_hour].append(split_event)
+                    yield hour, event, first_chunk
                     remaining_duration -= first_chunk
 
                 # Full hours in between
-                current_hour = (current_hour + 1) % 24
+                hour = (hour + 1) % 24
                 while remaining_duration > 3600:
-                    split_event = {**event, "duration": 3600}
-                    hourly[current_hour].append(split_event)
+                    yield hour, event, 3600
                     remaining_duration -= 3600
-                    current_hour = (current_hour + 1) % 24
+                    hour = (hour + 1) % 24
 
                 # Final partial hour
                 if remaining_duration > 0:
-                    split_event = {**event, "duration": remaining_duration}
-                    hourly[current_hour].append(split_event)
+                    yield hour, event, remaining_duration
 
         except Exception:
             continue
-    return dict(hourly)
 
 
-def aggregate_app_time(events: list) -> dict:
-    """Aggregate time by app name from window watcher events, excluding system processes."""
-    app_time = defaultdict(float)
-    for event in events:
-        app_raw = event.get("data", {}).get("app", "Unknown")
-        app = normalize_app_name(app_raw)
+def _aggregate_window_events(events: list) -> dict:
+    """One pass over a day's window-watcher events.
+
+    Returns {hour: (app_time, ai_chat_time, coding_tools, planning_tools)} —
+    hour splitting and every per-hour view come out of a single scan instead
+    of a bucketing pass followed by per-dimension aggregation passes.
+    """
+    hours: dict[int, tuple] = {}
+    for hour, event, duration in _iter_hour_shares(events):
+        views = hours.get(hour)
+        if views is None:
+            views = hours[hour] = ({}, {}, {}, {})
+        app_time, ai_time, tool_time, planning_time = views
+
+        data = event.get("data", {})
+        app = normalize_app_name(data.get("app", "Unknown"))
         # Skip excluded apps (loginwindow, screensaver, etc.)
         if app in EXCLUDED_APPS:
             continue
-        duration = event.get("duration", 0)
-        app_time[app] += duration
-    return dict(app_time)
-
-
-def aggregate_site_time(events: list) -> dict:
-    """Aggregate time by domain from web watcher events."""
-    site_time = defaultdict(float)
-    for event in events:
-        url = event.get("data", {}).get("url", "")
-        domain = urlparse(url).netloc
-        if domain:
-            duration = event.get("duration", 0)
-            site_time[domain] += duration
-    return dict(site_time)
-
-
-def aggregate_web_app_time(events: list) -> dict:
-    app_time = defaultdict(float)
-    for event in events:
-        bucket = event.get("_bucket", "")
-        match = re.search(r"watcher-web-([^_]+)", bucket)
-        app = match.group(1) if match else "browser"
-        duration = event.get("duration", 0) or 0
-        app_time[app.lower()] += duration
-    return dict(app_time)
+        app_time[app] = app_time.get(app, 0.0) + duration
+        if duration <= 0:
+            continue
 
+        if app in AI_CHAT_APPS:
+            name = ai_chat_app_display_name(app)
+            ai_time[name] = ai_time.get(name, 0.0) + duration
 
-def aggregate_ai_chat_time(web_events: list, window_events: list | None = None) -> dict:
-    """
-    Aggregate time spent on AI chat from web events and desktop apps.
-    Returns dict: {site_name: seconds} for AI chat with non-zero time.
-    """
-    ai_time = defaultdict(float)
+        # Terminal apps: inspect the window title for the actual tool;
+        # generic shell use falls back to "Terminal/Shell".
+        if app in TERMINAL_APPS:
+            tool = detect_terminal_tool(data.get("title", "")) or "Terminal/Shell"
+            tool_time[tool] = tool_time.get(tool, 0.0) + duration
+        elif app in CODING_APPS:
+            tool = coding_app_display_name(app)
+            tool_time[tool] = tool_time.get(tool, 0.0) + duration
 
-    # Process web events (browser-based AI chat)
-    for event in web_events:
-        url = event.get("data", {}).get("url", "")
-        domain = urlparse(url).netloc.lower()
-        duration = event.get("duration", 0) or 0
-        if duration <= 0:
-            continue
-        site_name = match_ai_chat_site(domain)
-        if site_name:
-            ai_time[site_name] += duration
+        if app in PLANNING_APPS:
+            display_name = app.title()
+            planning_time[display_name] = (
+                planning_time.get(display_name, 0.0) + duration
+            )
 
-    # Process window events (desktop AI chat apps)
-    if window_events:
-        for event in window_events:
-            app_raw = event.get("data", {}).get("app", "")
-            app = normalize_app_name(app_raw)
-            duration = event.get("duration", 0) or 0
-            if duration <= 0:
-                continue
-            if app in AI_CHAT_APPS:
-                ai_time[ai_chat_app_display_name(app)] += duration
+    return hours
 
-    return dict(ai_time)
 
+def _aggregate_web_events(events: list) -> dict:
+    """One pass over a day's web-watcher events.
 
-def aggregate_coding_tools_time(
-    window_events: list, web_events: list | None = None
-) -> dict:
+    Returns {hour: (site_time, web_app_time, ai_chat_time, dev_tools,
+    planning_sites)}. The caller merges the web views into the desktop ones.
     """
-    Aggregate time by coding tool with granular breakdown.
-    For terminal apps, inspects window title to determine actual tool.
-    Also includes browser-based dev tools (e.g., Google Colab, local notebooks).
-    Returns dict: {tool_name: seconds}
-    """
-    tool_time = defaultdict(float)
+    hours: dict[int, tuple] = {}
+    # A day has only a handful of distinct web buckets but thousands of
+    # events, so resolve each bucket name to a browser app exactly once.
+    bucket_to_app: dict[str, str] = {}
+
+    for hour, event, duration in _iter_hour_shares(events):
+        views = hours.get(hour)
+        if views is None:
+            views = hours[hour] = ({}, {}, {}, {}, {})
+        site_time, web_app_time, ai_time, dev_tools, planning_time = views
+
+        data = event.get("data", {})
+        url = data.get("url") or ""
+        # Slice the netloc out directly — browser-watcher URLs are always
+        # absolute, and a full urlparse per event is surprisingly heavy.
+        if "://" in url:
+            domain = url.split("/", 3)[2]
+            if "?" in domain or "#" in domain:
+                domain = domain.partition("?")[0].partition("#")[0]
+        else:
+            domain = ""
+        if domain:
+            site_time[domain] = site_time.get(domain, 0.0) + duration
 
-    for event in window_events:
-        app_raw = event.get("data", {}).get("app", "")
-        app = normalize_app_name(app_raw)
-        title = event.get("data", {}).get("title", "")
-        duration = event.get("duration", 0) or 0
+        bucket = event.get("_bucket", "")
+        app = bucket_to_app.get(bucket)
+        if app is None:
+            # "aw-watcher-web-firefox_host" -> "firefox"
+            rest = bucket.partition("watcher-web-")[2]
+            app = rest.split("_", 1)[0].lower() if rest else "browser"
+            bucket_to_app[bucket] = app
+        web_app_time[app] = web_app_time.get(app, 0.0) + duration
 
         if duration <= 0:
             continue
 
-        # Skip excluded apps
-        if app in EXCLUDED_APPS:
-            continue
-
-        # Check if this is a terminal app - inspect title for specific tool
-        if app in TERMINAL_APPS:
-            detected_tool = detect_terminal_tool(title)
-            if detected_tool:
-                tool_time[detected_tool] += duration
-            else:
-                # Generic terminal usage (shell, etc.)
-                tool_time["Terminal/Shell"] += duration
-        # Check if this is a known coding app (IDE, editor)
-        elif app in CODING_APPS:
-            tool_time[coding_app_display_name(app)] += duration
-
-    # Process web events for browser-based dev tools
-    if web_events:
-        for event in web_events:
-            url = event.get("data", {}).get("url", "")
-            title = event.get("data", {}).get("title", "")
-            duration = event.get("duration", 0) or 0
+        site_name = match_ai_chat_site(_lc(domain))
+        if site_name:
+            ai_time[site_name] = ai_time.get(site_name, 0.0) + duration
 
-            if duration <= 0:
-                continue
+        dev_tool_name = get_browser_dev_tool_name(url, data.get("title", ""))
+        if dev_tool_name:
+            dev_tools[dev_tool_name] = dev_tools.get(dev_tool_name, 0.0) + duration
 
-            dev_tool_name = get_browser_dev_tool_name(url, title)
-            if dev_tool_name:
-                tool_time[dev_tool_name] += duration
+        planning_site_name = get_planning_site_name(url)
+        if planning_site_name:
+            planning_time[planning_site_name] = (
+                planning_time.get(planning_site_name, 0.0) + duration
+            )
 
-    return dict(tool_time)
+    return hours
 
 
 def count_ai_chat_minutes(ai_time: dict) -> int:
@@ -344,45 +437,6 @@ def count_ai_chat_minutes(ai_time: dict) -> int:
     return max(0, round(total_seconds / 60))
 
 
-def aggregate_planning_time(
-    window_events: list, web_events: list, ai_chat_time: dict
-) -> dict:
-    """
-    Aggregate time spent on planning/architecting tools.
-    Includes: planning apps + planning/design web activity + AI chat time.
-    Returns dict: {tool_name: seconds}
-    """
-    planning_time = defaultdict(float)
-
-    # Add planning apps from window events
-    for event in window_events:
-        app_raw = event.get("data", {}).get("app", "")
-        app = normalize_app_name(app_raw)
-        duration = event.get("duration", 0) or 0
-        if duration <= 0:
-            continue
-        if app in PLANNING_APPS:
-            display_name = app.title()
-            planning_time[display_name] += duration
-
-    # Add planning/design websites from web events
-    for event in web_events:
-        url = event.get("data", {}).get("url", "")
-        duration = event.get("duration", 0) or 0
-        if duration <= 0:
-            continue
-
-        planning_site_name = get_planning_site_name(url)
-        if planning_site_name:
-            planning_time[planning_site_name] += duration
-
-    # Add AI chat time (already aggregated by site)
-    for site, seconds in ai_chat_time.items():
-        planning_time[site] += seconds
-
-    return dict(planning_time)
-
-
 def format_duration(seconds: float) -> str:
     """Format seconds as human-readable duration, rounded to nearest minute."""
     minutes = round(seconds / 60)
@@ -412,10 +466,17 @@ def compute_hourly_stats(all_data: dict, phone_hours: dict | None = None) -> dic
     afk_events_by_host = defaultdict(list)
 
     for bucket_name, events in all_data.items():
+        # Tag events with their bucket in place — events come fresh from the
+        # loader (or test fixtures) and aren't shared, so cloning every dict
+        # just to attach the tag would be pure allocation overhead.
         if "watcher-window" in bucket_name:
-            window_events.extend([{**e, "_bucket": bucket_name} for e in events])
+            for event in events:
+                event["_bucket"] = bucket_name
+            window_events.extend(events)
         elif "watcher-web" in bucket_name:
-            web_events.extend([{**e, "_bucket": bucket_name} for e in events])
+            for event in events:
+                event["_bucket"] = bucket_name
+            web_events.extend(events)
         elif "watcher-afk" in bucket_name:
             host = extract_host_from_bucket(bucket_name)
             if host:
@@ -446,20 +507,20 @@ def compute_hourly_stats(all_data: dict, phone_hours: dict | None = None) -> dic
         print("   - Terminal/IDE activity will NOT be tracked")
         print("   - Check if aw-watcher-window is running on your system")
 
-    # Bucket by hour
-    window_by_hour = bucket_events_by_hour(window_events)
-    web_by_hour = bucket_events_by_hour(web_events)
+    # Single fused scan per event class: hour splitting and every per-hour
+    # view come out of one trip through the events.
+    window_views = _aggregate_window_events(window_events)
+    web_views = _aggregate_web_events(web_events)
 
     # Get all hours with activity (phone-only hours count too)
-    all_hours = set(window_by_hour.keys()) | set(web_by_hour.keys()) | set(phone_hours.keys())
+    all_hours = set(window_views) | set(web_views) | set(phone_hours)
 
     hourly_stats = {}
     for hour in sorted(all_hours):
-        hour_window = window_by_hour.get(hour, [])
-        hour_web = web_by_hour.get(hour, [])
-
-        # Aggregate app time
-        app_time = aggregate_app_time(hour_window)
+        views = window_views.get(hour)
+        if views is None:
+            views = ({}, {}, {}, {})
+        app_time, ai_chat_time, coding_tools, planning_tools = views
 
         # Merge phone foreground time as activity. Like multi-device desktop
         # time, this can push an hour's active_time past 60 minutes — active_time
@@ -467,12 +528,24 @@ def compute_hourly_stats(all_data: dict, phone_hours: dict | None = None) -> dic
         for app, seconds in phone_hours.get(hour, {}).items():
             app_time[app] = app_time.get(app, 0) + seconds
 
-        # Aggregate site time
-        site_time = aggregate_site_time(hour_web)
-        web_app_time = aggregate_web_app_time(hour_web)
+        views = web_views.get(hour)
+        if views is None:
+            views = ({}, {}, {}, {}, {})
+        site_time, web_app_time, ai_chat_web, web_dev_tools, planning_sites = views
+
+        # Fold the web views into the desktop ones.
+        for name, seconds in ai_chat_web.items():
+            ai_chat_time[name] = ai_chat_time.get(name, 0.0) + seconds
+        for tool, seconds in web_dev_tools.items():
+            coding_tools[tool] = coding_tools.get(tool, 0.0) + seconds
+        for site, seconds in planning_sites.items():
+            planning_tools[site] = planning_tools.get(site, 0.0) + seconds
+        # Planning includes all AI chat time (browser + desktop).
+        for site, seconds in ai_chat_time.items():
+            planning_tools[site] = planning_tools.get(site, 0.0) + seconds
 
         # Top 3 sites
-        top_sites = sorted(site_time.items(), key=lambda x: -x[1])[:3]
+        top_sites = nlargest(3, site_time.items(), key=itemgetter(1))
 
         # Time on Notion (app or web)
         notion_time = app_time.get("notion", 0)
@@ -480,32 +553,17 @@ def compute_hourly_stats(all_data: dict, phone_hours: dict | None = None) -> dic
         notion_time += site_time.get("notion.so", 0)
 
         # Time on coding tools (apps + coding-related websites).
-        # `app_time` keys come from `aggregate_app_time` which uses
-        # `normalize_app_name`, so they are already lowercase.
-        coding_time = sum(
-            time for app, time in app_time.items() if app in CODING_APPS
-        )
-        # Add browser development activity using the same shared taxonomy as
-        # the granular breakdown and analytics exporter.
-        coding_time += sum(
-            event.get("duration", 0) or 0
-            for event in hour_web
-            if get_browser_dev_tool_name(
-                event.get("data", {}).get("url", ""),
-                event.get("data", {}).get("title", ""),
-            )
-        )
+        # `app_time` keys come from `normalize_app_name`, so they are
+        # already lowercase. Browser development activity uses the same
+        # shared taxonomy as the granular breakdown and analytics exporter.
+        # CODING_APPS is a fixed few dozen entries; app_time can be much
+        # larger, so probe the small set against the dict rather than the
+        # other way around.
+        coding_time = sum(app_time.get(app, 0.0) for app in CODING_APPS)
+        coding_time += sum(web_dev_tools.values())
 
-        # AI Chat time - aggregate by site (includes desktop AI chat apps)
-        ai_chat_time = aggregate_ai_chat_time(hour_web, hour_window)
         ai_chat_total = sum(ai_chat_time.values())
-
-        # Granular coding tools breakdown (with terminal tool detection + web dev tools)
-        coding_tools = aggregate_coding_tools_time(hour_window, hour_web)
         coding_tools_total = sum(coding_tools.values())
-
-        # Planning time (Notion, Logseq, etc. + AI chats)
-        planning_tools = aggregate_planning_time(hour_window, hour_web, ai_chat_time)
         planning_total = sum(planning_tools.values())
 
         # Fold categorised phone apps into the SAME work buckets as desktop tools,
@@ -521,9 +579,9 @@ def compute_hourly_stats(all_data: dict, phone_hours: dict | None = None) -> dic
         planning_total = sum(planning_tools.values())
 
         # Top 5 apps
-        top_apps = sorted(app_time.items(), key=lambda x: -x[1])[:5]
+        top_apps = nlargest(5, app_time.items(), key=itemgetter(1))
         if (not top_apps) and web_app_time:
-            top_apps = sorted(web_app_time.items(), key=lambda x: -x[1])[:5]
+            top_apps = nlargest(5, web_app_time.items(), key=itemgetter(1))
 
         # Total active time this hour
         total_app_time = sum(app_time.values())
@@ -531,6 +589,8 @@ def compute_hourly_stats(all_data: dict, phone_hours: dict | None = None) -> dic
         active_time = total_app_time if total_app_time > 0 else total_web_time
 
         hourly_stats[hour] = {
+            "app_time": app_time,
+            "site_time": site_time,
             "top_sites": top_sites,
             "notion_time": notion_time,
             "coding_time": coding_time,
@@ -585,13 +645,22 @@ def determine_hourly_select_value(hour_stats: dict) -> str | None:
     return None
 
 
-def format_hour_label(hour: int) -> str:
-    """Format hour as 12-hour time range."""
+def _hour_label(hour: int) -> str:
     start = datetime(2000, 1, 1, hour)
     end = start + timedelta(hours=1)
     return f"{start.strftime('%I%p').lstrip('0').lower()}-{end.strftime('%I%p').lstrip('0').lower()}"
 
 
+# 12-hour time-range labels ("1am-2am", ...) are static; build them once at
+# import instead of two datetimes + strftimes per hour per sync.
+_HOUR_LABELS = tuple(_hour_label(h) for h in range(24))
+
+
+def format_hour_label(hour: int) -> str:
+    """Format hour as 12-hour time range."""
+    return _HOUR_LABELS[hour]
+
+
 def compute_daily_summary(hourly_stats: dict) -> dict:
     """Compute daily totals from hourly stats."""
     total_active_time = 0
@@ -600,11 +669,11 @@ def compute_daily_summary(hourly_stats: dict) -> dict:
     total_ai_chat_time = 0
     total_coding_tools_time = 0
     total_planning_time = 0
-    all_apps = defaultdict(float)
-    all_sites = defaultdict(float)
-    all_ai_chats = defaultdict(float)
-    all_coding_tools = defaultdict(float)
-    all_planning_tools = defaultdict(float)
+    all_apps: dict[str, float] = {}
+    all_sites: dict[str, float] = {}
+    all_ai_chats: dict[str, float] = {}
+    all_coding_tools: dict[str, float] = {}
+    all_planning_tools: dict[str, float] = {}
 
     for stats in hourly_stats.values():
         total_active_time += stats.get("active_time", stats.get("total_app_time", 0))
@@ -613,16 +682,24 @@ def compute_daily_summary(hourly_stats: dict) -> dict:
         total_ai_chat_time += stats.get("ai_chat_total", 0)
         total_coding_tools_time += stats.get("coding_tools_total", 0)
         total_planning_time += stats.get("planning_total", 0)
-        for app, time in stats["top_apps"]:
-            all_apps[app] += time
-        for site, time in stats["top_sites"]:
-            all_sites[site] += time
+        # Prefer the full per-hour dicts: summing the truncated top-N lists
+        # would drop each hour's long tail from the daily ranking. Falling
+        # back to the top lists keeps hand-built stats (and the browser-only
+        # top_apps fallback for window-less hours) working.
+        app_time = stats.get("app_time")
+        app_items = app_time.items() if app_time else stats["top_apps"]
+        for app, time in app_items:
+            all_apps[app] = all_apps.get(app, 0.0) + time
+        site_time = stats.get("site_time")
+        site_items = site_time.items() if site_time else stats["top_sites"]
+        for site, time in site_items:
+            all_sites[site] = all_sites.get(site, 0.0) + time
         for ai_site, time in stats.get("ai_chat_time", {}).items():
-            all_ai_chats[ai_site] += time
+            all_ai_chats[ai_site] = all_ai_chats.get(ai_site, 0.0) + time
         for tool, time in stats.get("coding_tools", {}).items():
-            all_coding_tools[tool] += time
+            all_coding_tools[tool] = all_coding_tools.get(tool, 0.0) + time
         for tool, time in stats.get("planning_tools", {}).items():
-            all_planning_tools[tool] += time
+            all_planning_tools[tool] = all_planning_tools.get(tool, 0.0) + time
 
     return {
         "total_active_time": total_active_time,
@@ -631,25 +708,22 @@ def compute_daily_summary(hourly_stats: dict) -> dict:
         "total_ai_chat_time": total_ai_chat_time,
         "total_coding_tools_time": total_coding_tools_time,
         "total_planning_time": total_planning_time,
-        "top_apps": sorted(all_apps.items(), key=lambda x: -x[1])[:5],
-        "top_sites": sorted(all_sites.items(), key=lambda x: -x[1])[:5],
-        "ai_chats": sorted(all_ai_chats.items(), key=lambda x: -x[1]),
-        "coding_tools": sorted(all_coding_tools.items(), key=lambda x: -x[1]),
-        "planning_tools": sorted(all_planning_tools.items(), key=lambda x: -x[1]),
+        "top_apps": nlargest(5, all_apps.items(), key=itemgetter(1)),
+        "top_sites": nlargest(5, all_sites.items(), key=itemgetter(1)),
+        "ai_chats": sorted(all_ai_chats.items(), key=itemgetter(1), reverse=True),
+        "coding_tools": sorted(all_coding_tools.items(), key=itemgetter(1), reverse=True),
+        "planning_tools": sorted(all_planning_tools.items(), key=itemgetter(1), reverse=True),
     }
 
 
-def make_cell(text: str) -> list:
-    """Create a table cell with rich text."""
-    return [{"type": "text", "text": {"content": text}}]
-
-
 def make_table_row(cells: list) -> dict:
-    """Create a table_row block."""
+    """Create a table_row block from cell texts."""
     return {
         "object": "block",
         "type": "table_row",
-        "table_row": {"cells": [make_cell(c) for c in cells]},
+        "table_row": {
+            "cells": [[{"type": "text", "text": {"content": c}}] for c in cells]
+        },
     }
 
 
@@ -659,21 +733,19 @@ def format_tools_with_total(
     """
     Format tools time with total in brackets: [45m] Tool1: 15m, Tool2: 10m
     """
+    # Most hours have no tools in a given dimension — bail before any sort.
     total_mins = round(total_seconds / 60)
     if total_mins == 0:
         return "-"
 
-    # Sort by time descending
-    sorted_tools = sorted(tools.items(), key=lambda x: -x[1])[:max_items]
-    parts = []
-    for tool, seconds in sorted_tools:
-        mins = round(seconds / 60)
-        if mins > 0:
-            parts.append(f"{tool}: {mins}m")
-
-    breakdown = ", ".join(parts) if parts else ""
-    if breakdown:
-        return f"[{total_mins}m] {breakdown}"
+    top = nlargest(max_items, tools.items(), key=itemgetter(1))
+    parts = [
+        f"{tool}: {mins}m"
+        for tool, seconds in top
+        if (mins := round(seconds / 60)) > 0
+    ]
+    if parts:
+        return f"[{total_mins}m] {', '.join(parts)}"
     return f"[{total_mins}m]"
 
 
@@ -771,7 +843,7 @@ def build_notion_blocks(hourly_stats: dict) -> list:
         "object": "block",
         "type": "table",
         "table": {
-            "table_width": 6,
+            "table_width": AW_TABLE_WIDTH,
             "has_column_header": True,
             "has_row_header": False,
             "children": table_rows,
@@ -784,12 +856,19 @@ def build_notion_blocks(hourly_stats: dict) -> list:
 def find_and_clear_existing_blocks(notion: Client, page_id: str) -> None:
     """Find and delete existing AW stats table from the page by checking header row."""
     try:
-        children = notion.blocks.children.list(block_id=page_id)
+        children = notion.blocks.children.list(block_id=page_id, page_size=100)
 
         for block in children.get("results", []):
             if block.get("type") == "table":
+                # The parent listing already carries the table's shape; only
+                # tables matching ours are worth the extra per-table
+                # round trip to inspect the header row.
+                if block.get("table", {}).get("table_width") != AW_TABLE_WIDTH:
+                    continue
                 # Get the table's children (rows) to check the header
-                table_children = notion.blocks.children.list(block_id=block["id"])
+                table_children = notion.blocks.children.list(
+                    block_id=block["id"], page_size=1
+                )
                 rows = table_children.get("results", [])
 
                 if rows:
@@ -811,6 +890,11 @@ def find_and_clear_existing_blocks(notion: Client, page_id: str) -> None:
 
 def find_or_create_time_accounting_page(notion: Client, date_str: str) -> str:
     """Return the Time Accounting page ID for date_str, creating it when missing."""
+    cache = _read_sync_cache()
+    entry = cache.get(date_str)
+    if isinstance(entry, dict) and entry.get("page_id"):
+        return entry["page_id"]
+
     pages = notion.data_sources.query(
         data_source_id=NOTION_DATASOURCE_ID,
         filter={"property": "Date", "date": {"equals": date_str}},
@@ -819,6 +903,8 @@ def find_or_create_time_accounting_page(notion: Client, date_str: str) -> str:
     if pages:
         page_id = pages[0]["id"]
         print(f"Found page: {page_id}")
+        cache[date_str] = {"page_id": page_id}
+        _write_sync_cache(cache)
         return page_id
 
     created_page = notion.pages.create(
@@ -832,6 +918,8 @@ def find_or_create_time_accounting_page(notion: Client, date_str: str) -> str:
     )
     page_id = created_page["id"]
     print(f"Created Time Accounting page for {date_str}: {page_id}")
+    cache[date_str] = {"page_id": page_id}
+    _write_sync_cache(cache)
     return page_id
 
 
@@ -890,8 +978,32 @@ def build_sleep_contribution(date_str: str, existing_props: dict) -> Contributio
 
 def _replace_aw_blocks(notion: Client, page_id: str, blocks: list) -> None:
     """Swap the page's existing AW stats table for freshly rendered blocks."""
-    find_and_clear_existing_blocks(notion, page_id)
-    notion.blocks.children.append(block_id=page_id, children=blocks)
+    cache = _read_sync_cache()
+    entry = next(
+        (
+            e
+            for e in cache.values()
+            if isinstance(e, dict) and e.get("page_id") == page_id
+        ),
+        None,
+    )
+
+    cached_table_id = entry.get("table_block_id") if entry else None
+    if cached_table_id:
+        try:
+            notion.blocks.delete(block_id=cached_table_id)
+            print(f"Deleted existing table (cached id): {cached_table_id}")
+        except Exception:
+            # Stale id — fall back to discovering the table by its header.
+            find_and_clear_existing_blocks(notion, page_id)
+    else:
+        find_and_clear_existing_blocks(notion, page_id)
+
+    resp = notion.blocks.children.append(block_id=page_id, children=blocks) or {}
+    if entry is not None:
+        results = resp.get("results") or []
+        entry["table_block_id"] = results[0].get("id") if results else None
+        _write_sync_cache(cache)
 
 
 def sync_date(journal_date: date, notion: Client) -> bool:
@@ -915,6 +1027,11 @@ def sync_date(journal_date: date, notion: Client) -> bool:
         import traceback
 
         traceback.print_exc()
+        # The cached ids for this date may be what went stale; drop them so
+        # the next run re-discovers the page via query.
+        cache = _read_sync_cache()
+        if cache.pop(date_str, None) is not None:
+            _write_sync_cache(cache)
         return False
 
     print(f"Success: synced day page for {date_str}")
@@ -998,11 +1115,14 @@ Examples:
     # Connect to Notion once
     notion = Client(auth=NOTION_API_KEY)
 
-    # Sync each date
-    results = []
-    for journal_date in dates_to_sync:
-        success = sync_date(journal_date, notion)
-        results.append((journal_date, success))
+    # Sync each date. The sliding window means at most two dates, each
+    # dominated by Notion round trips, so run them concurrently on the
+    # shared client (notion-client reuses one session under the hood).
+    # The sidecar cache is best-effort, so a read-modify-write race between
+    # dates costs at worst a re-query next run.
+    with ThreadPoolExecutor(max_workers=len(dates_to_sync)) as pool:
+        successes = pool.map(lambda d: sync_date(d, notion), dates_to_sync)
+        results = list(zip(dates_to_sync, successes))
 
     # Summary
     print(f"\n{'=' * 50}")
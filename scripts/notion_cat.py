@@ -3,7 +3,6 @@
 # dependencies = [
 #     "mistune>=3.0",
 #     "notion-client",
-#     "python-dotenv",
 # ]
 # ///
 
@@ -17,17 +16,25 @@ from __future__ import annotations
 import argparse
 import os
 import platform
+import random
 import socket
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
-import mistune
-from dotenv import load_dotenv
 from notion_client import Client
 
+# Markdown rendering is optional outside the uv-managed environment: without
+# mistune the script still works, it just uploads .md files as code blocks.
+try:
+    import mistune
+except ImportError:
+    mistune = None
+
 
 MAX_RICH_TEXT_LEN = 1999
 MAX_RICH_TEXT_ITEMS = 100
@@ -65,12 +72,33 @@ def eprint(message: str) -> None:
     print(message, file=sys.stderr)
 
 
+def _load_env(path: Path) -> None:
+    """Minimal KEY=VALUE .env loader with load_dotenv's defaults (existing
+    environment wins, quotes stripped). Importing python-dotenv dominated
+    cold start for small invocations, and the repo's .env files are plain."""
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export ") :]
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        key = key.strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        if key:
+            os.environ.setdefault(key, value)
+
+
 def load_env_files(env_file: str | None) -> str | None:
     if env_file:
         env_path = Path(env_file).expanduser()
         if not env_path.exists():
             raise FileNotFoundError(f"env file not found: {env_path}")
-        load_dotenv(env_path)
+        _load_env(env_path)
         return str(env_path)
 
     candidates = [
@@ -84,7 +112,7 @@ def load_env_files(env_file: str | None) -> str | None:
             continue
         path = Path(candidate).expanduser()
         if path.exists():
-            load_dotenv(path)
+            _load_env(path)
             return str(path)
 
     return None
@@ -120,12 +148,25 @@ def default_title(paths: list[str], cwd_name: str, ts: str) -> str:
     return f"{len(paths)} files - {cwd_name} - {ts}"
 
 
+@lru_cache(maxsize=256)
+def _suffix(path: str) -> str:
+    """Lowercased extension of `path`, shared by the type/language sniffers
+    so each CLI argument is parsed once. Plain string ops: constructing a
+    PurePath just to read .suffix is the expensive part."""
+    name = path.rpartition("/")[2]
+    i = name.rfind(".")
+    return name[i:].lower() if i > 0 else ""
+
+
+MARKDOWN_SUFFIXES = frozenset({".md", ".mdx"})
+
+
 def infer_type_from_paths(paths: list[str]) -> str:
     if not paths:
         return DEFAULT_TYPE_OUTPUT
     if any(p == "-" for p in paths):
         return DEFAULT_TYPE_OUTPUT
-    if all(Path(p).suffix.lower() in {".md", ".mdx"} for p in paths):
+    if all(_suffix(p) in MARKDOWN_SUFFIXES for p in paths):
         return DEFAULT_TYPE_DOC
     return DEFAULT_TYPE_OUTPUT
 
@@ -138,7 +179,7 @@ def infer_language(paths: list[str]) -> str:
     for path in paths:
         if path == "-":
             return DEFAULT_LANGUAGE
-        lang = EXT_TO_LANG.get(Path(path).suffix.lower())
+        lang = EXT_TO_LANG.get(_suffix(path))
         if lang is None:
             return DEFAULT_LANGUAGE
         if first is None:
@@ -148,6 +189,43 @@ def infer_language(paths: list[str]) -> str:
     return first or DEFAULT_LANGUAGE
 
 
+def _slurp(file_path: Path) -> bytes:
+    """Read a whole file in one go via os.open/os.read.
+
+    Skips the BufferedReader construction (and its seek/isatty calls) that
+    Path.read_bytes still pays per file; the fstat size lets the common case
+    finish in a single syscall and allocation.
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size > 0:
+            data = os.read(fd, size)
+            if len(data) == size:
+                return data
+            # Short read on a regular file: the size is known, so finish
+            # into one preallocated buffer rather than chunk-and-join.
+            buf = bytearray(size)
+            pos = len(data)
+            buf[:pos] = data
+            view = memoryview(buf)
+            while pos < size:
+                n = os.readv(fd, [view[pos:]])
+                if n <= 0:
+                    break
+                pos += n
+            view.release()
+            del buf[pos:]
+            return bytes(buf)
+        # Special file whose st_size lies (procfs, pipes): read until EOF.
+        chunks = []
+        while chunk := os.read(fd, 1 << 17):
+            chunks.append(chunk)
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
 def read_all_inputs(paths: list[str]) -> tuple[bytes, str]:
     if not paths:
         if sys.stdin.isatty():
@@ -155,6 +233,15 @@ def read_all_inputs(paths: list[str]) -> tuple[bytes, str]:
         data = sys.stdin.buffer.read()
         return data, "stdin"
 
+    # Fast path for the typical `notion_cat foo.log` invocation: no chunk
+    # list, no source-label bookkeeping.
+    if len(paths) == 1 and paths[0] != "-":
+        file_path = Path(paths[0])
+        try:
+            return _slurp(file_path), file_path.name
+        except FileNotFoundError:
+            raise FileNotFoundError(f"file not found: {file_path}")
+
     chunks: list[bytes] = []
     stdin_cache = b""
     stdin_loaded = False
@@ -168,20 +255,20 @@ def read_all_inputs(paths: list[str]) -> tuple[bytes, str]:
 
         file_path = Path(path)
         try:
-            chunks.append(file_path.read_bytes())
+            chunks.append(_slurp(file_path))
         except FileNotFoundError:
             raise FileNotFoundError(f"file not found: {file_path}")
 
-    data = b"".join(chunks)
-    if len(paths) == 1 and paths[0] != "-":
-        return data, Path(paths[0]).name
+    # b"".join is already a single gather pass (a BytesIO sink would copy
+    # once on write and again on getvalue); with one chunk skip even that.
+    data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
     return data, f"files:{len(paths)}"
 
 
-def chunk_rich_text(text: str) -> list[dict]:
+def chunk_rich_text(text: str, _ml: int = MAX_RICH_TEXT_LEN) -> list[dict]:
     return [
-        {"type": "text", "text": {"content": text[i : i + MAX_RICH_TEXT_LEN]}}
-        for i in range(0, len(text), MAX_RICH_TEXT_LEN)
+        {"type": "text", "text": {"content": text[i : i + _ml]}}
+        for i in range(0, len(text), _ml)
     ]
 
 
@@ -189,20 +276,21 @@ def build_code_blocks(text: str, language: str) -> list[dict]:
     if text == "":
         return []
     notion_language = normalize_notion_language(language)
-    items = chunk_rich_text(text)
-    blocks = []
-    for idx in range(0, len(items), MAX_RICH_TEXT_ITEMS):
-        blocks.append(
-            {
-                "object": "block",
-                "type": "code",
-                "code": {
-                    "rich_text": items[idx : idx + MAX_RICH_TEXT_ITEMS],
-                    "language": notion_language,
-                },
-            }
-        )
-    return blocks
+    # Each code block holds at most MAX_RICH_TEXT_ITEMS items of
+    # MAX_RICH_TEXT_LEN chars; chunk each block's span of text directly
+    # instead of materializing the full item list and re-slicing it.
+    block_span = MAX_RICH_TEXT_ITEMS * MAX_RICH_TEXT_LEN
+    return [
+        {
+            "object": "block",
+            "type": "code",
+            "code": {
+                "rich_text": chunk_rich_text(text[start : start + block_span]),
+                "language": notion_language,
+            },
+        }
+        for start in range(0, len(text), block_span)
+    ]
 
 
 NOTION_LANG_ALIASES = {
@@ -287,81 +375,99 @@ def _is_valid_notion_url(url: str) -> bool:
 
 
 def _ast_inline_to_rich_text(children: list[dict]) -> list[dict]:
-    items: list[dict] = []
+    # Emit straight into the final list; only oversized items pay the split.
+    out: list[dict] = []
     for child in children:
-        items.extend(_inline_token_to_rich_text(child, {}))
-    split_items: list[dict] = []
-    for item in items:
-        split_items.extend(_split_rich_text_item(item))
-    return split_items
+        for item in _inline_token_to_rich_text(child, 0):
+            if len(item["text"]["content"]) <= MAX_RICH_TEXT_LEN:
+                out.append(item)
+            else:
+                out.extend(_split_rich_text_item(item))
+    return out
+
+
+# Annotations travel through the inline walk as an int bitmask — no dict is
+# allocated per styled span. The dict form is materialized (and shared, as
+# the split path already does) only at leaf emission, memoized per mask.
+_ANN_BOLD = 1
+_ANN_ITALIC = 2
+_ANN_CODE = 4
+_ANN_STRIKETHROUGH = 8
+
+_ANN_NAMES = (
+    (_ANN_BOLD, "bold"),
+    (_ANN_ITALIC, "italic"),
+    (_ANN_CODE, "code"),
+    (_ANN_STRIKETHROUGH, "strikethrough"),
+)
 
 
-def _merge_annotations(base: dict, override: dict) -> dict:
-    merged = dict(base)
-    merged.update(override)
-    return merged
+@lru_cache(maxsize=16)
+def _ann_dict(flags: int) -> dict | None:
+    if not flags:
+        return None
+    return {name: True for bit, name in _ANN_NAMES if flags & bit}
 
 
-def _inline_leaf(token: dict, annotations: dict) -> list[dict]:
+def _inline_leaf(token: dict, flags: int) -> list[dict]:
     raw = token.get("raw", token.get("text", ""))
     if not raw:
         return []
-    return [_notion_rich_text(raw, annotations or None)]
+    return [_notion_rich_text(raw, _ann_dict(flags))]
 
 
-def _inline_recurse(token: dict, annotations: dict) -> list[dict]:
+def _inline_recurse(token: dict, flags: int) -> list[dict]:
     items: list[dict] = []
     for child in token.get("children", []):
-        items.extend(_inline_token_to_rich_text(child, annotations))
+        items.extend(_inline_token_to_rich_text(child, flags))
     return items
 
 
-def _handle_inline_codespan(token: dict, ann: dict) -> list[dict]:
-    return _inline_leaf(token, _merge_annotations(ann, {"code": True}))
+def _handle_inline_codespan(token: dict, flags: int) -> list[dict]:
+    return _inline_leaf(token, flags | _ANN_CODE)
 
 
-def _handle_inline_strong(token: dict, ann: dict) -> list[dict]:
-    return _inline_recurse(token, _merge_annotations(ann, {"bold": True}))
+def _handle_inline_strong(token: dict, flags: int) -> list[dict]:
+    return _inline_recurse(token, flags | _ANN_BOLD)
 
 
-def _handle_inline_emphasis(token: dict, ann: dict) -> list[dict]:
-    return _inline_recurse(token, _merge_annotations(ann, {"italic": True}))
+def _handle_inline_emphasis(token: dict, flags: int) -> list[dict]:
+    return _inline_recurse(token, flags | _ANN_ITALIC)
 
 
-def _handle_inline_strikethrough(token: dict, ann: dict) -> list[dict]:
-    return _inline_recurse(token, _merge_annotations(ann, {"strikethrough": True}))
+def _handle_inline_strikethrough(token: dict, flags: int) -> list[dict]:
+    return _inline_recurse(token, flags | _ANN_STRIKETHROUGH)
 
 
-def _handle_inline_link(token: dict, ann: dict) -> list[dict]:
+def _handle_inline_link(token: dict, flags: int) -> list[dict]:
     url = (token.get("attrs") or {}).get("url") or token.get("link") or ""
     is_valid_link = _is_valid_notion_url(url)
-    base_ann = dict(ann) if ann else {}
     items: list[dict] = []
     for child in token.get("children", []):
-        child_items = _inline_token_to_rich_text(child, base_ann)
+        child_items = _inline_token_to_rich_text(child, flags)
         if is_valid_link:
             for ci in child_items:
                 ci["text"]["link"] = {"url": url}
         items.extend(child_items)
     if not items:
         raw = token.get("raw", url)
-        rt = _notion_rich_text(raw, base_ann or None)
+        rt = _notion_rich_text(raw, _ann_dict(flags))
         if is_valid_link:
             rt["text"]["link"] = {"url": url}
         items.append(rt)
     return items
 
 
-def _handle_inline_break(_token: dict, _ann: dict) -> list[dict]:
+def _handle_inline_break(_token: dict, _flags: int) -> list[dict]:
     return [_notion_rich_text("\n")]
 
 
-def _handle_inline_image(token: dict, _ann: dict) -> list[dict]:
+def _handle_inline_image(token: dict, _flags: int) -> list[dict]:
     alt = "".join(c.get("raw", c.get("text", "")) for c in token.get("children", []))
     return [_notion_rich_text(alt or "[image]")]
 
 
-def _handle_inline_html(token: dict, _ann: dict) -> list[dict]:
+def _handle_inline_html(token: dict, _flags: int) -> list[dict]:
     raw = token.get("raw", token.get("text", ""))
     return [_notion_rich_text(raw)] if raw else []
 
@@ -380,11 +486,11 @@ _INLINE_HANDLERS = {
 }
 
 
-def _inline_token_to_rich_text(token: dict, annotations: dict) -> list[dict]:
+def _inline_token_to_rich_text(token: dict, flags: int) -> list[dict]:
     handler = _INLINE_HANDLERS.get(token.get("type", ""))
     if handler is not None:
-        return handler(token, annotations)
-    return _inline_leaf(token, annotations)
+        return handler(token, flags)
+    return _inline_leaf(token, flags)
 
 
 def _make_block(block_type: str, rich_text: list[dict], **extra: object) -> dict:
@@ -451,10 +557,7 @@ def _table_to_block(token: dict) -> list[dict]:
 
 
 def _ast_to_blocks(tokens: list[dict]) -> list[dict]:
-    blocks: list[dict] = []
-    for token in tokens:
-        blocks.extend(_token_to_blocks(token))
-    return blocks
+    return [block for token in tokens for block in _token_to_blocks(token)]
 
 
 _QUOTE_INLINE_PARENT_TYPES = frozenset(
@@ -484,11 +587,18 @@ def _handle_block_heading(token: dict) -> list[dict]:
     ]
 
 
+@lru_cache(maxsize=128)
+def _resolve_fence_language(info: str) -> str:
+    """Notion language for a fence info string; cached since docs repeat the
+    same handful of fences (python, bash, ...) many times over."""
+    lang = info.split()[0] if info else ""
+    return normalize_notion_language(lang)
+
+
 def _handle_block_code(token: dict) -> list[dict]:
     code = token.get("raw", token.get("text", ""))
     info = token.get("attrs", {}).get("info", "") or ""
-    lang = info.split()[0] if info else ""
-    notion_lang = normalize_notion_language(lang)
+    notion_lang = _resolve_fence_language(info)
     rt = chunk_rich_text(code)
     return [
         _make_block("code", rt[i : i + MAX_RICH_TEXT_ITEMS], language=notion_lang)
@@ -600,14 +710,22 @@ def _list_item_to_blocks(token: dict, ordered: bool) -> list[dict]:
     return [block] + overflow_blocks + promoted
 
 
-def build_markdown_blocks(text: str) -> list[dict]:
-    if not text.strip():
-        return []
-    md = mistune.create_markdown(
+# create_markdown compiles regex tables and wires plugin hooks; build the
+# parser once at import rather than per call.
+_MARKDOWN = (
+    mistune.create_markdown(
         renderer=None,
         plugins=["strikethrough", "table"],
     )
-    tokens = md(text)
+    if mistune is not None
+    else None
+)
+
+
+def build_markdown_blocks(text: str) -> list[dict]:
+    if not text.strip():
+        return []
+    tokens = _MARKDOWN(text)
     return _ast_to_blocks(tokens)
 
 
@@ -645,6 +763,21 @@ def make_notes(cwd_name: str, input_desc: str, ts: str) -> str:
     return f"cwd={cwd_name}; input={input_desc}; captured={ts}"
 
 
+def _retry_sleep(exc: Exception, attempt: int) -> float:
+    """Backoff delay before retry `attempt`: honour a Retry-After header on
+    429s, otherwise exponential with jitter so parallel appends don't retry
+    in lockstep."""
+    if getattr(exc, "status", None) == 429:
+        headers = getattr(exc, "headers", None) or {}
+        retry_after = headers.get("Retry-After") or headers.get("retry-after")
+        try:
+            if retry_after is not None:
+                return min(30.0, float(retry_after))
+        except (TypeError, ValueError):
+            pass
+    return min(30.0, (1.5**attempt) * random.uniform(0.5, 1.5))
+
+
 def _is_retryable_error(exc: Exception) -> bool:
     status = getattr(exc, "status", None)
     if status in (403, 429):
@@ -687,7 +820,7 @@ def create_page(
             attempt += 1
             if not _is_retryable_error(exc) or attempt > 4:
                 raise
-            time.sleep(1.5**attempt)
+            time.sleep(_retry_sleep(exc, attempt))
 
 
 def append_blocks(notion: Client, page_id: str, blocks: list[dict]) -> None:
@@ -715,11 +848,24 @@ def append_blocks(notion: Client, page_id: str, blocks: list[dict]) -> None:
                 retryable = _is_retryable_error(exc)
                 if not retryable or attempt > 4:
                     raise exc
-                time.sleep(1.5**attempt)
-
-    for created_id, children in zip(created_ids, pending):
-        if children and created_id:
-            append_blocks(notion, created_id, children)
+                time.sleep(_retry_sleep(exc, attempt))
+
+    # Top-level batches must stay sequential (the page is a concatenation,
+    # so inter-request order matters), but the recursive child appends each
+    # target a different created block — overlap their HTTP latency.
+    tasks = [
+        (created_id, children)
+        for created_id, children in zip(created_ids, pending)
+        if children and created_id
+    ]
+    if len(tasks) == 1:
+        append_blocks(notion, tasks[0][0], tasks[0][1])
+    elif tasks:
+        with ThreadPoolExecutor(max_workers=min(4, len(tasks))) as pool:
+            for _ in pool.map(
+                lambda task: append_blocks(notion, task[0], task[1]), tasks
+            ):
+                pass
 
 
 def parse_args() -> argparse.Namespace:
@@ -779,8 +925,14 @@ def main() -> int:
         return 2
 
     if not (args.no_stdout or args.suppress_output):
-        sys.stdout.buffer.write(data)
-        sys.stdout.buffer.flush()
+        # Echo straight to the fd in 1 MiB slices: os.write skips the
+        # BufferedIO layer (and its flush bookkeeping) for large captures.
+        sys.stdout.flush()
+        fd = sys.stdout.fileno()
+        view = memoryview(data)
+        pos = 0
+        while pos < len(view):
+            pos += os.write(fd, view[pos : pos + (1 << 20)])
 
     inferred_type = infer_type_from_paths(args.files)
     inferred_lang = infer_language(args.files)
@@ -800,7 +952,9 @@ def main() -> int:
     language = normalize_notion_language(
         args.lang or os.environ.get("NOTION_CAT_LANG") or inferred_lang
     )
-    use_markdown = inferred_lang == "markdown" and not args.raw
+    use_markdown = (
+        inferred_lang == "markdown" and not args.raw and _MARKDOWN is not None
+    )
     mode = "markdown" if use_markdown else "code"
 
     if args.dry_run:
@@ -819,24 +973,31 @@ def main() -> int:
 
     notion = Client(auth=token)
 
-    properties = build_properties(
-        title=title, type_value=type_value, source=source, notes=notes
-    )
-    page = create_page(
-        notion,
-        data_source_id=data_source_id,
-        properties=properties,
-    )
+    # Decoding and block building are pure CPU over local data; run them
+    # while the create_page round trip is in flight.
+    def _build_blocks() -> list[dict]:
+        text = data.decode("utf-8", errors="replace")
+        if use_markdown:
+            return build_markdown_blocks(text)
+        return build_code_blocks(text, language)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        blocks_future = pool.submit(_build_blocks)
+        properties = build_properties(
+            title=title, type_value=type_value, source=source, notes=notes
+        )
+        page = create_page(
+            notion,
+            data_source_id=data_source_id,
+            properties=properties,
+        )
+        blocks = blocks_future.result()
+
     page_id = page.get("id")
     if not page_id:
         eprint("failed to create page (no id returned)")
         return 1
 
-    text = data.decode("utf-8", errors="replace")
-    if use_markdown:
-        blocks = build_markdown_blocks(text)
-    else:
-        blocks = build_code_blocks(text, language)
     if blocks:
         append_blocks(notion, page_id, blocks)
     elif not args.suppress_output:
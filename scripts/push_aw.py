@@ -1,6 +1,6 @@
 # /// script
 # requires-python = ">3.11"
-# dependencies= ["requests"]
+# dependencies= ["requests", "orjson"]
 # ///
 
 
@@ -10,17 +10,45 @@ import json
 import subprocess
 import socket
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from collections import Counter
 from zoneinfo import ZoneInfo
 
+# C-level JSON encoder for the multi-megabyte daily dumps; stdlib fallback
+# keeps the script runnable outside the uv-managed environment.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- CONFIGURATION ---
 SLEEPER_SERVICE_ALIAS = "sleeper-service"
 SLEEPER_SERVICE_DEST_DIR = "~/dotfiles/scripts/aw-data/"  # Ensure this folder exists on sleeper-service
 TARGET_TZ = ZoneInfo(os.getenv("TARGET_TZ", "Asia/Singapore"))
 WATCHER_BUCKET_PREFIXES = ("aw-watcher-window", "aw-watcher-web", "aw-watcher-afk")
+AW_BUCKETS_CACHE = os.path.expanduser("~/.cache/aw-buckets.json")
+AW_BUCKETS_CACHE_TTL = 86400  # bucket topology barely changes within a day
+AW_SYNC_SPOOL = os.path.expanduser("~/.cache/aw-sync-spool.json")
 # ---------------------
 
+# Keep-alive session for the local AW server: one socket across the
+# /buckets call and every per-bucket /events call instead of a fresh TCP
+# connection each time.
+SESSION = requests.Session()
+SESSION.mount(
+    "http://", requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=8)
+)
+
+
+def _json(resp):
+    # Deserialization dominates a full day of events; orjson parses the raw
+    # bytes ~2x faster than the stdlib decoder behind resp.json().
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
 
 def count_events(data):
     return sum(len(events) for events in data.values())
@@ -75,7 +103,83 @@ def hostname_matches_current_machine(bucket_hostname, current_hostname):
     return bool(aliases(bucket_hostname) & aliases(current_hostname))
 
 
-def get_aw_data(target_date=None):
+def get_buckets_cached(base_url, hostname, refresh=False):
+    """Return the /buckets response, cached on disk for a day.
+
+    Bucket topology (hostnames, watcher kinds) changes when a watcher is
+    installed, essentially never within a day, so skip the round-trip when
+    a fresh cache for this host exists. Best-effort: any cache problem
+    falls back to a live fetch.
+    """
+    if not refresh:
+        try:
+            if os.path.getmtime(AW_BUCKETS_CACHE) > time.time() - AW_BUCKETS_CACHE_TTL:
+                with open(AW_BUCKETS_CACHE, "rb") as f:
+                    raw = f.read()
+                cached = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                if cached.get("hostname") == hostname:
+                    return cached["buckets"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    buckets = _json(SESSION.get(f"{base_url}/buckets"))
+
+    entry = {"hostname": hostname, "buckets": buckets}
+    try:
+        os.makedirs(os.path.dirname(AW_BUCKETS_CACHE), exist_ok=True)
+        with open(AW_BUCKETS_CACHE, "wb") as f:
+            if orjson is not None:
+                f.write(orjson.dumps(entry))
+            else:
+                f.write(json.dumps(entry).encode())
+    except OSError:
+        pass
+
+    return buckets
+
+
+def _load_spool(date_str):
+    """Load the local spool of already-fetched events for this journal day.
+
+    Repeated runs through the day only need to fetch events newer than what
+    the previous run saw; the spool holds the rest so the upload still
+    carries a complete day. Best-effort: any problem means a full fetch.
+    """
+    try:
+        with open(AW_SYNC_SPOOL, "rb") as f:
+            raw = f.read()
+        spool = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if spool.get("date") == date_str:
+            return spool
+    except (OSError, ValueError):
+        pass
+    return {"date": date_str, "events": {}}
+
+
+def _save_spool(spool):
+    try:
+        os.makedirs(os.path.dirname(AW_SYNC_SPOOL), exist_ok=True)
+        with open(AW_SYNC_SPOOL, "wb") as f:
+            if orjson is not None:
+                f.write(orjson.dumps(spool))
+            else:
+                f.write(json.dumps(spool).encode())
+    except OSError:
+        pass
+
+
+def _event_key(event):
+    return event.get("id") or (event.get("timestamp"), event.get("duration"))
+
+
+def _merge_events(cached, fresh):
+    merged = {_event_key(event): event for event in cached}
+    for event in fresh:
+        merged[_event_key(event)] = event
+    return list(merged.values())
+
+
+def get_aw_data(target_date=None, refresh_buckets=False):
     base_url = "http://localhost:5600/api/0"
     hostname = socket.gethostname()
 
@@ -92,29 +196,56 @@ def get_aw_data(target_date=None):
         )
         end_time = start_of_day + timedelta(days=1)
 
-    params = {"start": start_of_day.isoformat(), "end": end_time.isoformat()}
-
-    resp = requests.get(f"{base_url}/buckets")
-    buckets = resp.json()
+    buckets = get_buckets_cached(base_url, hostname, refresh=refresh_buckets)
 
-    target_data = {}
-
-    watcher_bucket_ids = []
-    for bucket_id, bucket in buckets.items():
-        if bucket_id.startswith(WATCHER_BUCKET_PREFIXES):
-            watcher_bucket_ids.append(bucket_id)
+    watcher_buckets = [
+        (bucket_id, bucket)
+        for bucket_id, bucket in buckets.items()
+        if bucket_id.startswith(WATCHER_BUCKET_PREFIXES)
+    ]
+    if not watcher_buckets:
+        # Nothing to fetch on this server (misconfigured or bare install);
+        # skip the spool load and hostname filtering outright.
+        return {}
+    watcher_bucket_ids = [bucket_id for bucket_id, _ in watcher_buckets]
+
+    # limit=-1 asks AW for the whole window explicitly instead of relying on
+    # the server default cap, so a busy day never comes back truncated.
+    params = {
+        "start": start_of_day.isoformat(),
+        "end": end_time.isoformat(),
+        "limit": -1,
+    }
+
+    spool = _load_spool(start_of_day.strftime("%Y-%m-%d"))
+    spooled_events = spool["events"]
 
     def fetch_events(bucket_id):
         print(f"Fetching events for: {bucket_id}")
-        return requests.get(
-            f"{base_url}/buckets/{bucket_id}/events", params=params
-        ).json()
+        cached = spooled_events.get(bucket_id)
+        bucket_params = params
+        if cached:
+            # Re-fetch from the newest cached event's start so the still-open
+            # event's growing duration gets refreshed rather than duplicated.
+            bucket_params = dict(params)
+            bucket_params["start"] = max(event["timestamp"] for event in cached)
+        fresh = _json(
+            SESSION.get(f"{base_url}/buckets/{bucket_id}/events", params=bucket_params)
+        )
+        return _merge_events(cached, fresh) if cached else fresh
+
+    def fetch_many(bucket_ids):
+        # The per-bucket fetches are independent round-trips to the same
+        # local server, so overlap them; the session's pool backs the workers.
+        if not bucket_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(bucket_ids))) as pool:
+            return dict(zip(bucket_ids, pool.map(fetch_events, bucket_ids)))
 
     selected_bucket_ids = []
-    for bucket_id in watcher_bucket_ids:
+    for bucket_id, bucket in watcher_buckets:
         # Filter 1: Only buckets for THIS computer (hostname check, case-insensitive)
         # Filter 2: Only the watchers we care about (Window, Web, AFK)
-        bucket = buckets.get(bucket_id)
         metadata_hostname = None
         if isinstance(bucket, dict):
             metadata_hostname = bucket.get("hostname")
@@ -128,29 +259,32 @@ def get_aw_data(target_date=None):
         if is_this_host:
             selected_bucket_ids.append(bucket_id)
 
-    for bucket_id in selected_bucket_ids:
-        # Structure: { "bucket_id": [event1, event2...] }
-        target_data[bucket_id] = fetch_events(bucket_id)
+    def finish(data):
+        spooled_events.update(data)
+        _save_spool(spool)
+        return data
+
+    # Structure: { "bucket_id": [event1, event2...] }
+    target_data = fetch_many(selected_bucket_ids)
 
     if any(target_data.values()):
-        return target_data
+        return finish(target_data)
 
     if target_data:
         print(
             "Selected hostname buckets were empty; checking all watcher buckets for non-empty data."
         )
 
-    fallback_data = {}
     fetched_bucket_ids = set(target_data)
-    for bucket_id in watcher_bucket_ids:
-        if bucket_id in fetched_bucket_ids:
-            continue
-        events = fetch_events(bucket_id)
-        if events:
-            fallback_data[bucket_id] = events
+    remaining = [bid for bid in watcher_bucket_ids if bid not in fetched_bucket_ids]
+    fallback_data = {
+        bucket_id: events
+        for bucket_id, events in fetch_many(remaining).items()
+        if events
+    }
 
     if fallback_data:
-        return fallback_data
+        return finish(fallback_data)
 
     return {}
 
@@ -172,29 +306,51 @@ def sync_to_sleeper_service(data, target_date=None):
 
     # Filename includes hostname so it won't overwrite data from other machines
     filename = f"aw_{hostname}_{date_str}.json"
-    local_path = f"/tmp/{filename}"
 
-    with open(local_path, "w") as f:
-        json.dump(data, f)
+    if orjson is not None:
+        encode = orjson.dumps
+    else:
+        encode = lambda obj: json.dumps(obj).encode()  # noqa: E731
 
     print(f"Pushing {filename} to {SLEEPER_SERVICE_ALIAS}...")
 
-    # Using the SSH alias directly
+    # Stream straight over SSH instead of spilling to /tmp and rsyncing:
+    # the dump only exists to be sent once, so skip the local write/cleanup.
+    # -C compresses on the wire; the JSON is full of repeated app names,
+    # URLs, and timestamps, so it shrinks several-fold on slow uplinks.
     cmd = [
-        "rsync",
-        "-az",
-        local_path,
-        f"{SLEEPER_SERVICE_ALIAS}:{SLEEPER_SERVICE_DEST_DIR}",
+        "ssh",
+        "-C",
+        SLEEPER_SERVICE_ALIAS,
+        f"cat > {SLEEPER_SERVICE_DEST_DIR}{filename}",
     ]
 
+    # Serialize one bucket at a time into the pipe instead of encoding the
+    # whole dump up front, so peak memory stays at the largest bucket's
+    # payload rather than parsed objects plus one giant bytes buffer.
     try:
-        subprocess.run(cmd, check=True)
-        print("Sync success.")
-        subprocess.run(["rm", local_path])  # Cleanup
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Sync failed. Check SSH connection to '{SLEEPER_SERVICE_ALIAS}'.")
-        return False
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+        try:
+            write = proc.stdin.write
+            write(b"{")
+            for i, (bucket_id, events) in enumerate(data.items()):
+                if i:
+                    write(b",")
+                write(encode(bucket_id))
+                write(b":")
+                write(encode(events))
+            write(b"}")
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        if proc.wait() == 0:
+            print("Sync success.")
+            return True
+    except OSError:
+        pass
+
+    print(f"Sync failed. Check SSH connection to '{SLEEPER_SERVICE_ALIAS}'.")
+    return False
 
 
 if __name__ == "__main__":
@@ -210,6 +366,11 @@ if __name__ == "__main__":
         action="store_true",
         help="Push yesterday's data",
     )
+    parser.add_argument(
+        "--refresh-buckets",
+        action="store_true",
+        help="Ignore the cached bucket list and re-fetch it",
+    )
     args = parser.parse_args()
 
     target_date = None
@@ -218,7 +379,10 @@ if __name__ == "__main__":
     elif args.date:
         target_date = datetime.strptime(args.date, "%Y-%m-%d").date()
 
-    data = get_aw_data(target_date)
+    try:
+        data = get_aw_data(target_date, refresh_buckets=args.refresh_buckets)
+    finally:
+        SESSION.close()
     if count_events(data) > 0:
         sync_to_sleeper_service(data, target_date)
     else:
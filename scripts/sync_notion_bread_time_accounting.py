@@ -8,6 +8,7 @@
 # ///
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from notion_client import Client
@@ -22,6 +23,30 @@ NOTION_DATASOURCE_ID = os.getenv("NOTION_TIME_ACCOUNTING_DATASOURCE_ID")
 NOTION_BREAD_DATASOURCE_ID = os.getenv("NOTION_BREAD_DATASOURCE_ID")
 TARGET_TIMEZONE = ZoneInfo(os.getenv("CURRENT_TIMEZONE", "Asia/Singapore"))
 
+# Statuses that count as "done" for the daily task roll-up
+COMPLETED_STATUSES = ("Done", "Delegated", "DNF")
+
+# Date-independent part of the bread query: built once instead of ~20 nested
+# literals per run, and the status list stays in one place.
+_BREAD_STATUS_FILTER = {
+    "or": [
+        {"property": "Status", "status": {"equals": status}}
+        for status in COMPLETED_STATUSES
+    ]
+}
+
+
+def bread_filter(today_str):
+    """Completed tasks whose date range contains today."""
+    return {
+        "and": [
+            {"property": "Date", "date": {"on_or_before": today_str}},
+            {"property": "Date", "date": {"on_or_after": today_str}},
+            _BREAD_STATUS_FILTER,
+        ]
+    }
+
+
 def main():
     today_str = datetime.now(TARGET_TIMEZONE).strftime("%Y-%m-%d")
     print(f"Retrieving tasks for {today_str}")
@@ -29,56 +54,30 @@ def main():
     notion = Client(auth=NOTION_API_KEY)
 
     try:
-        time_accounting_page = notion.data_sources.query(
-            data_source_id=NOTION_DATASOURCE_ID,
-            filter={"property": "Date", "date": {"equals": today_str}},
-        ).get("results")
+        # The two queries are independent, so overlap their round-trips;
+        # the relation update below depends on both results.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            time_accounting_future = pool.submit(
+                notion.data_sources.query,
+                data_source_id=NOTION_DATASOURCE_ID,
+                filter={"property": "Date", "date": {"equals": today_str}},
+            )
+
+            # get the bread pages which fit the filter condition of containing today in the date range
+            # and that are DONE.
+            bread_future = pool.submit(
+                notion.data_sources.query,
+                data_source_id=NOTION_BREAD_DATASOURCE_ID,
+                filter=bread_filter(today_str),
+            )
+
+            time_accounting_page = time_accounting_future.result().get("results")
+            bread_pages = bread_future.result().get("results")
 
         if not time_accounting_page:
             print(f"No Time accounting page found for today, {today_str}")
             return
 
-        # get the bread pages which fit the filter condition of containing today in the date range
-        # and that are DONE.
-
-        bread_pages = notion.data_sources.query(
-            data_source_id=NOTION_BREAD_DATASOURCE_ID,
-            filter={
-                "and": [
-                    {
-                        "property": "Date",
-                        "date": {"on_or_before": today_str}
-                    },
-                    {
-                        "property": "Date",
-                        "date": {"on_or_after": today_str}
-                    },
-                    {
-                        "or": [
-                            {
-                                "property": "Status",
-                                "status": {
-                                "equals": "Done"
-                                }
-                            },
-                            {
-                                "property": "Status",
-                                "status": {
-                                "equals": "Delegated"
-                                }
-                            },
-                            {
-                                "property": "Status",
-                                "status": {
-                                "equals": "DNF"
-                                }
-                            }
-                        ]
-                    }
-                ]
-            }
-        ).get("results")
-
         if not bread_pages:
             print(f"No completed tasks in the tasks data source on {today_str}")
             return
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import sys
+import tempfile
 import unittest
 from datetime import date
 from pathlib import Path
@@ -13,6 +15,35 @@ import aw_notion_sync
 import notion_day
 
 
+def setUpModule() -> None:
+    # Point the page-id sidecar cache at a throwaway file so test runs never
+    # read (or leave behind) cached ids next to the real script.
+    global _cache_patcher
+    _cache_patcher = patch.object(
+        aw_notion_sync,
+        "AW_SYNC_CACHE",
+        os.path.join(tempfile.mkdtemp(), ".aw_sync_cache.json"),
+    )
+    _cache_patcher.start()
+
+
+def tearDownModule() -> None:
+    _cache_patcher.stop()
+
+
+class _FreshCacheTest(unittest.TestCase):
+    """Base for tests that run through sync_date: the sidecar cache persists
+    page ids across calls, so start each test without one — otherwise a test
+    can silently take the cache-hit path instead of the query path its fake
+    client was built to serve."""
+
+    def setUp(self) -> None:
+        try:
+            os.unlink(aw_notion_sync.AW_SYNC_CACHE)
+        except FileNotFoundError:
+            pass
+
+
 class _FakeDataSources:
     def __init__(self) -> None:
         self.queries = []
@@ -37,7 +68,7 @@ class _FakeNotion:
         self.pages = _FakePages()
 
 
-class SyncDateTests(unittest.TestCase):
+class SyncDateTests(_FreshCacheTest):
     def test_creates_page_even_when_hourly_stats_are_empty(self) -> None:
         notion = _FakeNotion()
 
@@ -110,7 +141,7 @@ class _RecordingNotion:
         self.blocks = _RecordingBlocks(self.appended)
 
 
-class SleepEnrichmentTests(unittest.TestCase):
+class SleepEnrichmentTests(_FreshCacheTest):
     def test_tags_bio_hours_and_writes_sleep_property(self) -> None:
         notion = _RecordingNotion()
         fake_sleep = {
@@ -180,7 +211,7 @@ class SleepEnrichmentTests(unittest.TestCase):
         self.assertTrue(any("00:00" in u for u in notion.updates))
 
 
-class ContributorSeamTests(unittest.TestCase):
+class ContributorSeamTests(_FreshCacheTest):
     """Phase 0: the day page is written by independent contributors, so sleep
     logs even on days with no ActivityWatch (desktop) data — the blind spot."""
 
@@ -208,6 +239,67 @@ class ContributorSeamTests(unittest.TestCase):
         self.assertEqual({"number": 7.55}, prop_update["Sleep Hours"])
 
 
+class SyncCacheTests(_FreshCacheTest):
+    """The sidecar cache short-circuits the page query and remembers the stats
+    table's block id; stale ids must fall back to discovery."""
+
+    def test_cached_page_id_skips_the_query(self) -> None:
+        aw_notion_sync._write_sync_cache({"2026-06-14": {"page_id": "page-1"}})
+        notion = _FakeNotion()
+
+        page_id = aw_notion_sync.find_or_create_time_accounting_page(
+            notion, "2026-06-14"
+        )
+
+        self.assertEqual("page-1", page_id)
+        self.assertEqual([], notion.data_sources.queries)  # cache hit, no query
+        self.assertEqual([], notion.pages.created)
+
+    def test_stale_table_id_falls_back_to_discovery(self) -> None:
+        aw_notion_sync._write_sync_cache(
+            {"2026-06-14": {"page_id": "page-1", "table_block_id": "stale-table"}}
+        )
+
+        class _Children:
+            def __init__(self):
+                self.listed = []
+                self.appended = []
+
+            def list(self, block_id, **kwargs):
+                self.listed.append(block_id)
+                return {"results": []}
+
+            def append(self, block_id, children):
+                self.appended.append(children)
+                return {"results": [{"id": "fresh-table"}]}
+
+        class _Blocks:
+            def __init__(self):
+                self.children = _Children()
+                self.deleted = []
+
+            def delete(self, block_id):
+                self.deleted.append(block_id)
+                raise RuntimeError("Could not find block")  # id went stale
+
+        class _Notion:
+            def __init__(self):
+                self.blocks = _Blocks()
+
+        notion = _Notion()
+        aw_notion_sync._replace_aw_blocks(notion, "page-1", [{"type": "table"}])
+
+        # The stale delete was attempted, discovery ran against the page, the
+        # fresh table still got appended, and the cache learned the new id.
+        self.assertEqual(["stale-table"], notion.blocks.deleted)
+        self.assertEqual(["page-1"], notion.blocks.children.listed)
+        self.assertEqual(1, len(notion.blocks.children.appended))
+        self.assertEqual(
+            "fresh-table",
+            aw_notion_sync._read_sync_cache()["2026-06-14"]["table_block_id"],
+        )
+
+
 class PhoneMergeTests(unittest.TestCase):
     """Phone foreground time merges into the hourly activity model, so a
     phone-only hour (no desktop) still registers as active."""
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import json
+import os
 import sys
+import tempfile
 import unittest
 from datetime import date
 from pathlib import Path
@@ -12,15 +15,58 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 import push_aw
 
 
+def setUpModule() -> None:
+    # Point the bucket-list cache and the delta-fetch spool at throwaway
+    # files so test runs never read (or leave behind) state next to the
+    # real script.
+    global _cache_patcher, _spool_patcher
+    cache_dir = tempfile.mkdtemp()
+    _cache_patcher = patch.object(
+        push_aw,
+        "AW_BUCKETS_CACHE",
+        os.path.join(cache_dir, "aw-buckets.json"),
+    )
+    _spool_patcher = patch.object(
+        push_aw,
+        "AW_SYNC_SPOOL",
+        os.path.join(cache_dir, "aw-sync-spool.json"),
+    )
+    _cache_patcher.start()
+    _spool_patcher.start()
+
+
+def tearDownModule() -> None:
+    _spool_patcher.stop()
+    _cache_patcher.stop()
+
+
 class _Response:
     def __init__(self, payload):
         self._payload = payload
 
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode()
+
     def json(self):
         return self._payload
 
 
-class PushAwBucketSelectionTests(unittest.TestCase):
+class _FreshStateTest(unittest.TestCase):
+    """Base for tests that call get_aw_data: the bucket cache and the event
+    spool persist across calls, so start each test without them — no test
+    should silently ride an earlier test's cached topology or spooled
+    events."""
+
+    def setUp(self) -> None:
+        for path in (push_aw.AW_BUCKETS_CACHE, push_aw.AW_SYNC_SPOOL):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+
+class PushAwBucketSelectionTests(_FreshStateTest):
     def test_hostname_match_handles_tailscale_numeric_suffix(self) -> None:
         self.assertTrue(
             push_aw.hostname_matches_current_machine(
@@ -85,7 +131,7 @@ class PushAwBucketSelectionTests(unittest.TestCase):
                 "gethostname",
                 return_value="elijahs-macbook-air-2.tail82ff8b.ts.net",
             ),
-            patch.object(push_aw.requests, "get", side_effect=fake_get),
+            patch.object(push_aw.SESSION, "get", side_effect=fake_get),
         ):
             data = push_aw.get_aw_data(date(2026, 7, 2))
 
@@ -141,7 +187,7 @@ class PushAwBucketSelectionTests(unittest.TestCase):
 
         with (
             patch.object(push_aw.socket, "gethostname", return_value="Mac"),
-            patch.object(push_aw.requests, "get", side_effect=fake_get),
+            patch.object(push_aw.SESSION, "get", side_effect=fake_get),
         ):
             data = push_aw.get_aw_data(date(2026, 7, 2))
 
@@ -158,5 +204,62 @@ class PushAwBucketSelectionTests(unittest.TestCase):
         )
 
 
+class DeltaFetchTests(_FreshStateTest):
+    """Repeat runs spool fetched events and only ask AW for what's newer."""
+
+    def test_second_run_fetches_from_newest_spooled_ts_and_merges_by_id(self) -> None:
+        buckets = {"aw-watcher-window_Mac": {"hostname": "Mac"}}
+        first_events = [
+            {
+                "id": 1,
+                "timestamp": "2026-07-02T10:00:00+08:00",
+                "duration": 60,
+                "data": {"app": "Zen"},
+            }
+        ]
+        # By the second run the open event has grown and a new one started.
+        second_events = [
+            {
+                "id": 1,
+                "timestamp": "2026-07-02T10:00:00+08:00",
+                "duration": 120,
+                "data": {"app": "Zen"},
+            },
+            {
+                "id": 2,
+                "timestamp": "2026-07-02T10:02:00+08:00",
+                "duration": 30,
+                "data": {"app": "Ghostty"},
+            },
+        ]
+        event_params = []
+
+        def make_get(events):
+            def fake_get(url, params=None):
+                if url.endswith("/buckets"):
+                    return _Response(buckets)
+                event_params.append(params)
+                return _Response(events)
+
+            return fake_get
+
+        with patch.object(push_aw.socket, "gethostname", return_value="Mac"):
+            with patch.object(push_aw.SESSION, "get", side_effect=make_get(first_events)):
+                push_aw.get_aw_data(date(2026, 7, 2))
+            with patch.object(push_aw.SESSION, "get", side_effect=make_get(second_events)):
+                data = push_aw.get_aw_data(date(2026, 7, 2))
+
+        # First run covers the whole day; the second asks only from the
+        # newest spooled event's start (so the open event gets refreshed).
+        self.assertEqual("2026-07-02T00:00:00+08:00", event_params[0]["start"])
+        self.assertEqual("2026-07-02T10:00:00+08:00", event_params[1]["start"])
+
+        # The re-fetched copy replaces the stale one by id — no duplicates.
+        merged = data["aw-watcher-window_Mac"]
+        self.assertEqual(
+            {1: 120, 2: 30}, {event["id"]: event["duration"] for event in merged}
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -21,8 +21,10 @@ import os
 import sys
 import argparse
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, date
 from zoneinfo import ZoneInfo
+from urllib3.util.retry import Retry
 from notion_client import Client
 from dotenv import load_dotenv
 
@@ -40,6 +42,22 @@ TARGET_TZ = ZoneInfo(os.getenv("TARGET_TZ", "Asia/Singapore"))
 # How many hours into "today" we continue to update "yesterday"
 FREEZE_HOURS = int(os.getenv("FREEZE_HOURS", "2"))
 
+# Keep-alive session so the sliding-window dates reuse one WakaTime connection
+# (TLS handshake included); transient 5xx responses retry with backoff instead
+# of failing the run, and the timeout keeps a hung connection from blocking
+# the script indefinitely.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(
+        max_retries=Retry(
+            total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)
+        ),
+        pool_maxsize=4,
+    ),
+)
+REQUEST_TIMEOUT = (5, 15)  # (connect, read) seconds
+
 
 def sync_date(target_date: date, notion: Client) -> bool:
     """
@@ -52,9 +70,9 @@ def sync_date(target_date: date, notion: Client) -> bool:
     # WakaTime Fetch
     wt_url = "https://wakatime.com/api/v1/users/current/summaries"
     try:
-        resp = requests.get(wt_url, params={
+        resp = SESSION.get(wt_url, params={
             "start": date_str, "end": date_str, "api_key": WAKATIME_API_KEY
-        })
+        }, timeout=REQUEST_TIMEOUT)
         resp.raise_for_status()
         data = resp.json().get("data", [])
         if not data:
@@ -160,11 +178,13 @@ Examples:
     # Connect to Notion once
     notion = Client(auth=NOTION_API_KEY)
     
-    # Sync each date
-    results = []
-    for target_date in dates_to_sync:
-        success = sync_date(target_date, notion)
-        results.append((target_date, success))
+    # Sync the dates concurrently: each one is a WakaTime GET plus a Notion
+    # query/update against its own page, so the window syncs in one round of
+    # round-trips instead of one per date.
+    with ThreadPoolExecutor(max_workers=len(dates_to_sync)) as pool:
+        results = list(
+            zip(dates_to_sync, pool.map(lambda d: sync_date(d, notion), dates_to_sync))
+        )
     
     # Summary
     print(f"\nSync complete:")